@@ -0,0 +1,67 @@
+"""
+Check that the scan pipeline ranks deals globally when the poster falls behind.
+
+    python pipeline_check.py
+
+Runs run_scan_cycle over 8 keywords with 8 weak listings each. The last
+keyword also has one strong listing. Pages come back quickly and posting
+is slow, so the poster falls behind. The strong deal must be posted as
+soon as the poster is free, not behind the weak ones from earlier keywords.
+"""
+import asyncio
+import os
+import sys
+import time
+
+os.environ.setdefault("DISCORD_TOKEN", "pipeline-check")  # bot.py refuses to import without one
+import bot
+
+KEYWORDS = [f"k{n}" for n in range(1, 9)]
+
+def listing(query: str, n: int, title: str) -> dict:
+    return {
+        "title": title,
+        "price_text": "£8",
+        "price_num": 8.0,
+        "link": f"https://www.vinted.co.uk/items/{query}-{n}",
+        "image": None,
+        "is_new_member": False,
+    }
+
+def stand_in_get_page(query: str, price_to: int, use_cache: bool = True):
+    time.sleep(0.01)
+    listings = [listing(query, n, f"clothes bundle {query} lot {n}") for n in range(8)]
+    if query == KEYWORDS[-1]:
+        listings.append(listing(query, 99, "clothes bundle 20 items nike"))
+    return listings, {"status": 200}
+
+async def main() -> int:
+    bot.get_page = stand_in_get_page
+    bot.KEYWORDS[:] = KEYWORDS
+    bot.seen_items.clear()
+
+    posted = []
+    async def slow_post(channel, query, items, limit=8):
+        await asyncio.sleep(0.2)  # Discord is much slower than fetching + filtering
+        posted.append((query, items[0]["title"], items[0]["profit_score"]))
+        return 1
+    bot.post_items = slow_post
+
+    await bot.run_scan_cycle(None)
+
+    titles = [title for _query, title, _score in posted]
+    best = titles.index("clothes bundle 20 items nike") if "clothes bundle 20 items nike" in titles else None
+
+    failures = []
+    def check(ok: bool, what: str):
+        print(f"{'PASS' if ok else 'FAIL'}  {what}")
+        if not ok:
+            failures.append(what)
+
+    check(len(posted) == len(KEYWORDS) * bot.POST_LIMIT_PER_KEYWORD, "every keyword's deals were posted")
+    # Only the post already in progress when k8 was filtered may go ahead of it
+    check(best is not None and best <= 1, f"top deal from the last keyword posted first (position {best})")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
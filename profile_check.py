@@ -0,0 +1,74 @@
+"""
+Check that /profile's sampler ranks the bot's real work, not idle plumbing.
+
+    python profile_check.py
+
+Runs scan-like work under a real asyncio loop: get_page with a stand-in
+session that sleeps like network I/O, then select_items on a large page.
+The main thread sits in the event loop in between. Checks that
+parse_listings or select_items rank near the top, that event-loop frames
+don't appear at all, and that sleeping in download_page isn't counted
+as CPU.
+"""
+import asyncio
+import os
+import sys
+import time
+
+os.environ.setdefault("DISCORD_TOKEN", "profile-check")  # bot.py refuses to import without one
+import bot
+
+PAGE = "".join(
+    f'<div class="feed-grid__item"><a href="/items/{i}" title="clothes bundle {i} items"></a>'
+    f'<span data-testid="price">£8</span></div>'
+    for i in range(400)
+)
+
+class StandInResponse:
+    status_code = 200
+    text = PAGE
+
+def slow_get(session, url):
+    time.sleep(0.3)  # stands in for waiting on the network
+    return StandInResponse()
+
+async def workload():
+    for n in range(3):
+        listings, _meta = await asyncio.to_thread(bot.get_page, f"check {n}", 20, False)
+        await asyncio.to_thread(bot.select_items, listings, 20, True, True)
+        await asyncio.sleep(0.2)  # main thread idles in the event loop
+
+async def main() -> int:
+    bot.PooledSession.get = slow_get
+    bot.random.uniform = lambda a, b: 0.3  # the "human" delay in download_page
+
+    profiler = bot.ScanProfiler(1)
+    profiler.start()
+    await workload()
+    profiler.stop()
+
+    ranked = profiler.hottest(50)
+    hottest = [name for name, _total, _self in ranked[:6]]
+    download = next((pct for name, _total, pct in ranked if name.startswith("download_page ")), 0.0)
+    plumbing = ("<module>", "run_forever", "_run_once", "select (selectors.py")
+
+    failures = []
+    def check(ok: bool, what: str):
+        print(f"{'PASS' if ok else 'FAIL'}  {what}")
+        if not ok:
+            failures.append(what)
+
+    check(profiler.samples > 0, "sampler recorded bot work")
+    check(any(n.startswith(("parse_listings ", "select_items ")) for n in hottest),
+          "parse_listings/select_items rank near the top")
+    check(not any(name.startswith(plumbing) for name, _total, _self in ranked),
+          "event loop plumbing isn't counted")
+    if profiler.cpu_clocks:
+        check(download < 20, f"sleeping in download_page isn't CPU ({download:.1f}% self)")
+
+    print(profiler.hot_heading())
+    print("\n".join(profiler.hot_lines(8)))
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,95 @@
+"""
+Exercise the HTTP session pool against local stand-in proxies (no Vinted traffic).
+
+    python proxy_pool_check.py
+
+Starts two plain HTTP proxies on 127.0.0.1: one always answers 200, the
+other answers 429 to its first request. Checks that the throttled session
+is rested, leases move to the healthy one, the rested session becomes
+eligible again without jumping the queue, each session keeps its own user
+agent and cookies, and download_page retries a throttled fetch elsewhere.
+"""
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+os.environ.setdefault("DISCORD_TOKEN", "proxy-pool-check")  # bot.py refuses to import without one
+import bot
+
+def start_proxy(name: str, throttle_first: int):
+    class Handler(BaseHTTPRequestHandler):
+        hits = 0
+        agents = set()
+        cookies = []
+
+        def do_GET(self):
+            Handler.hits += 1
+            Handler.agents.add(self.headers.get("User-Agent"))
+            Handler.cookies.append(self.headers.get("Cookie"))
+            status = 429 if Handler.hits <= throttle_first else 200
+            self.send_response(status)
+            self.send_header("Set-Cookie", f"session={name}")
+            self.end_headers()
+            self.wfile.write(b"<html></html>")
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}", Handler
+
+def main() -> int:
+    bot.SESSION_REST_SECONDS = 1
+    healthy_url, healthy = start_proxy("healthy", throttle_first=0)
+    flaky_url, flaky = start_proxy("flaky", throttle_first=1)
+    pool = bot.SessionPool(2, [healthy_url, flaky_url])
+
+    def fetch():
+        with pool.lease() as session:
+            session.get("http://vinted.test/catalog")
+            return session
+
+    failures = []
+    def check(ok: bool, what: str):
+        print(f"{'PASS' if ok else 'FAIL'}  {what}")
+        if not ok:
+            failures.append(what)
+
+    # Both start at full health; keep leasing until the flaky proxy has been tried once
+    for _ in range(2):
+        fetch()
+    flaky_session = next(s for s in pool.sessions if s.proxy == flaky_url)
+    check(flaky_session.last_status == 429 and flaky_session.resting(time.monotonic()), "429 rests the session")
+
+    during_rest = {fetch().proxy for _ in range(3)}
+    check(during_rest == {healthy_url}, "leases avoid the resting session")
+
+    time.sleep(1.2)
+    check(not flaky_session.resting(time.monotonic()), "rest ends on schedule")
+    check(fetch().proxy == healthy_url, "healthier session is still leased first")
+    with pool.lease() as busy:
+        # With the healthy session busy, the rested one is eligible again
+        with pool.lease() as spare:
+            check(busy.proxy == healthy_url and spare is flaky_session, "rested session returns to rotation")
+
+    check(len(healthy.agents) == 1 and len(flaky.agents) == 1, "each session keeps one user agent")
+    check("session=healthy" in (healthy.cookies[-1] or ""), "cookies persist per session")
+    print(pool.summary())
+
+    # download_page retries a throttled response once on another session
+    blocker_url, _blocker = start_proxy("blocker", throttle_first=1)
+    retry_pool = bot.SessionPool(2, [healthy_url, blocker_url])
+    retry_pool.sessions[0].health = 0.5  # make the blocker the first pick
+    bot.session_pool = retry_pool
+    bot.BASE_URL = "http://vinted.test/catalog"  # plain HTTP so the stand-in proxies can answer
+    bot.random.uniform = lambda a, b: 0
+    _listings, meta = bot.download_page("retry check", 20)
+    check(meta["status"] == 200 and meta["retried"], "throttled fetch is retried on another session")
+
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())